@@ -1,13 +1,25 @@
 import asyncio
+import io
 import json
 import os
+import time
 import argparse
 import edge_tts
 import pandas as pd
-from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
 from pydub import AudioSegment
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+try:
+    import av  # PyAV：libav 进程内解码，免去每次解码 fork 一个 ffmpeg
+except ImportError:
+    av = None
+
+try:
+    import orjson  # checkpoint 序列化比 stdlib json 快一个量级
+except ImportError:
+    orjson = None
+
 def parse_args():
     parser = argparse.ArgumentParser(description="Edge-TTS 批量语音合成工具 (适配 原文/平假名/翻译 CSV)")
     parser.add_argument("-i", "--input", default="dari01.csv", help="输入的 CSV 文件路径")
@@ -15,11 +27,70 @@ def parse_args():
     parser.add_argument("-r", "--rate", default="-5%", help="语速")
     parser.add_argument("-n", "--repeat", type=int, default=3, help="单句重复朗读次数")
     parser.add_argument("-c", "--concurrent", type=int, default=5, help="最大并发下载任务数")
+    parser.add_argument("-m", "--max_rps", type=float, default=5.0, help="每秒最大请求数 (0 表示不限速)")
     parser.add_argument("-s", "--silence", type=int, default=1000, help="句子之间的停顿毫秒数")
     parser.add_argument("-o", "--output_dir", default="edge_tts_output", help="结果输出目录")
     parser.add_argument("-f", "--sub_format", choices=['lrc', 'srt', 'both'], default='both', help="字幕格式")
     return parser.parse_args()
 
+def decode_mp3(data):
+    """MP3 字节 -> AudioSegment。优先 PyAV 进程内解码，未安装时退回 pydub+ffmpeg"""
+    if av is None:
+        return AudioSegment.from_file(io.BytesIO(data), format="mp3")
+    with av.open(io.BytesIO(data)) as container:
+        stream = container.streams.audio[0]
+        resampler = av.AudioResampler(format="s16", layout=stream.layout, rate=stream.sample_rate)
+        pcm = bytearray()
+        for frame in container.decode(stream):
+            for out in resampler.resample(frame):
+                pcm.extend(out.to_ndarray().tobytes())
+        return AudioSegment(bytes(pcm), sample_width=2,
+                            frame_rate=stream.sample_rate, channels=stream.channels)
+
+# Layer III 帧头解析表（用于识别并跳过 Xing/Info 信息帧）
+MP3_BITRATES_V1 = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320)
+MP3_BITRATES_V2 = (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)
+MP3_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+def strip_mp3_tags(data):
+    """去掉开头的 ID3v2 标签和 Xing/Info 信息帧。
+
+    ffmpeg 导出的 MP3 自带这两样：按字节拼进流中间会形成非法数据，
+    且 Xing 头只声明本段的帧数，混入整轨会让播放器误判总时长。
+    """
+    # ID3v2：10 字节固定头 + synchsafe 编码的标签长度
+    if data[:3] == b"ID3" and len(data) >= 10:
+        size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+        data = data[10 + size:]
+    # 首帧若是 Xing/Info 信息帧（不含音频），整帧丢弃
+    if len(data) > 4 and data[0] == 0xFF and (data[1] & 0xE0) == 0xE0:
+        version = (data[1] >> 3) & 0x03  # 3=MPEG1, 2=MPEG2, 0=MPEG2.5
+        bitrate_idx = (data[2] >> 4) & 0x0F
+        rate_idx = (data[2] >> 2) & 0x03
+        if version != 1 and bitrate_idx not in (0, 15) and rate_idx != 3:
+            bitrate = (MP3_BITRATES_V1 if version == 3 else MP3_BITRATES_V2)[bitrate_idx] * 1000
+            sample_rate = MP3_SAMPLE_RATES[version][rate_idx]
+            factor = 144 if version == 3 else 72
+            frame_len = factor * bitrate // sample_rate + ((data[2] >> 1) & 0x01)
+            if b"Xing" in data[:frame_len] or b"Info" in data[:frame_len]:
+                data = data[frame_len:]
+    return data
+
+def encode_silence_mp3(duration_ms):
+    """把静音预编码成 MP3 字节，供帧级拼接使用（24kHz 与 Edge-TTS 输出一致）"""
+    buf = io.BytesIO()
+    AudioSegment.silent(duration=duration_ms, frame_rate=24000).export(buf, format="mp3")
+    return strip_mp3_tags(buf.getvalue())
+
+FLUSH_EVERY = 20  # 每累计多少行进度落盘一次 checkpoint
+
+def read_csv_fast(path):
+    """优先用 pyarrow 引擎解析 CSV（多线程 C 实现），未安装时退回默认引擎"""
+    try:
+        return pd.read_csv(path, engine="pyarrow")
+    except (ImportError, ValueError):
+        return pd.read_csv(path)
+
 class MultiVoiceEngine:
     def __init__(self, args):
         self.args = args
@@ -30,28 +101,56 @@ class MultiVoiceEngine:
         
         self.voice_list = [v.strip() for v in args.voice.split(",")]
         self.semaphore = asyncio.Semaphore(args.concurrent)
+        # 漏桶限速：按 1/max_rps 间隔放行请求，避免触发服务端限流和指数退避重试
+        self._rate_lock = asyncio.Lock()
+        self._last_request = 0.0
+        self._min_interval = 1 / args.max_rps if args.max_rps > 0 else 0.0
         self.progress = self.load_progress()
+        self._snippets = {}  # 本次运行合成的 MP3 字节缓存，合并阶段免去磁盘读取
+        self._dirty = False
+        self._unflushed = 0
+        self._synth_cache = {}  # (文本, 音色) -> 合成任务，重复词条不再重复请求
+        # 静音只编码一次，所有行复用同一份 MP3 字节
+        self._silence_intra = encode_silence_mp3(300) # 句间微停顿
+        self._silence_inter = encode_silence_mp3(args.silence)
 
         if not os.path.exists(self.snippets_dir):
             os.makedirs(self.snippets_dir)
 
     def load_progress(self):
         if os.path.exists(self.progress_file):
-            with open(self.progress_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(self.progress_file, 'rb') as f:
+                data = f.read()
+            return orjson.loads(data) if orjson is not None else json.loads(data)
         return {}
 
     def save_progress(self, index, metadata):
         self.progress[str(index)] = metadata
-        with open(self.progress_file, 'w', encoding='utf-8') as f:
-            json.dump(self.progress, f, ensure_ascii=False, indent=2)
+        self._dirty = True
+        self._unflushed += 1
+        if self._unflushed >= FLUSH_EVERY:
+            self._flush_progress()
+
+    def _flush_progress(self):
+        """原子落盘：先写临时文件再 os.replace，中断也不会留下半截 JSON"""
+        if not self._dirty:
+            return
+        if orjson is not None:
+            payload = orjson.dumps(self.progress)
+        else:
+            payload = json.dumps(self.progress, ensure_ascii=False, separators=(",", ":")).encode('utf-8')
+        tmp_file = self.progress_file + ".tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_file, self.progress_file)
+        self._dirty = False
+        self._unflushed = 0
 
     def format_srt_time(self, ms):
-        td = timedelta(milliseconds=ms)
-        total_sec = int(td.total_seconds())
-        h, m, s = total_sec // 3600, (total_sec % 3600) // 60, total_sec % 60
-        ms_part = int(td.microseconds / 1000)
-        return f"{h:02}:{m:02}:{s:02},{ms_part:03}"
+        s, ms_part = divmod(ms, 1000)
+        m, s = divmod(s, 60)
+        h, m = divmod(m, 60)
+        return f"{h:02d}:{m:02d}:{s:02d},{ms_part:03d}"
 
     def format_lrc_time(self, ms):
         total_seconds = ms // 1000
@@ -60,46 +159,85 @@ class MultiVoiceEngine:
         cs = (ms % 1000) // 10
         return f"[{m:02}:{s:02}.{cs:02}]"
 
+    async def _throttle(self):
+        if not self._min_interval:
+            return
+        async with self._rate_lock:
+            wait = self._min_interval - (time.monotonic() - self._last_request)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._last_request = time.monotonic()
+
     @retry(stop=stop_after_attempt(5), wait=wait_exponential(multiplier=1, min=2, max=10))
-    async def synthesize_single(self, text, voice, path):
-        communicate = edge_tts.Communicate(text, voice, rate=self.args.rate)
-        await communicate.save(path)
+    async def synthesize_single(self, text, voice):
+        """流式合成：返回 (MP3 缓冲, 时长ms)，时长取自 WordBoundary 事件，无需解码"""
+        # 信号量放在单次合成上，而不是整行任务上，让并发额度均匀用满
+        async with self.semaphore:
+            await self._throttle()
+            communicate = edge_tts.Communicate(text, voice, rate=self.args.rate)
+            buf = io.BytesIO()
+            last_end_ms = 0
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    buf.write(chunk["data"])
+                elif chunk["type"] == "WordBoundary":
+                    # offset/duration 的单位是 100 纳秒
+                    last_end_ms = max(last_end_ms, (chunk["offset"] + chunk["duration"]) // 10000)
+            buf.seek(0)
+            return buf, last_end_ms
+
+    def synthesize_cached(self, text, voice):
+        """同一 (文本, 音色) 只合成一次：背单词 CSV 常有重复词条，直接共享任务结果"""
+        key = (text, voice)
+        task = self._synth_cache.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self.synthesize_single(text, voice))
+            self._synth_cache[key] = task
+        return task
 
     async def process_entry(self, index, original, hiragana, translation):
         """处理单行：使用平假名发音，原文和翻译作为字幕内容"""
         if str(index) in self.progress:
             return
             
-        async with self.semaphore:
-            print(f"[处理中] 行 {index}: {original[:15]}...")
-            combined_segment = AudioSegment.empty()
-            
-            for r in range(self.args.repeat):
-                current_voice = self.voice_list[r % len(self.voice_list)]
-                temp_snippet_path = os.path.join(self.snippets_dir, f"temp_{index}_{r}.mp3")
-                
-                # 读音强制使用平假名列
-                await self.synthesize_single(hiragana, current_voice, temp_snippet_path)
-                
-                snippet_audio = AudioSegment.from_mp3(temp_snippet_path)
-                combined_segment += snippet_audio
-                
-                if r < self.args.repeat - 1:
-                    combined_segment += AudioSegment.silent(duration=300) # 句间微停顿
-                
-                if os.path.exists(temp_snippet_path):
-                    os.remove(temp_snippet_path)
-
-            snippet_filename = f"snippet_{index}.mp3"
-            snippet_path = os.path.join(self.snippets_dir, snippet_filename)
-            combined_segment.export(snippet_path, format="mp3")
-            
-            self.save_progress(index, {
-                "original": original,
-                "translation": translation,
-                "duration_ms": len(combined_segment),
-                "file": snippet_filename
-            })
+        print(f"[处理中] 行 {index}: {original[:15]}...")
+
+        # 读音强制使用平假名列；同一行的多次重复并发合成，按原顺序拼接
+        results = await asyncio.gather(*[
+            self.synthesize_cached(hiragana, self.voice_list[r % len(self.voice_list)])
+            for r in range(self.args.repeat)])
+
+        chunks = []
+        duration_ms = 0
+        for r, (buf, rep_ms) in enumerate(results):
+            rep_bytes = buf.getvalue()
+            chunks.append(rep_bytes)
+
+            if rep_ms <= 0:
+                # 该次合成没收到 WordBoundary 事件，回退到解码测长
+                # （逐段解码，不把静音的间隔误计进时长）
+                rep_ms = len(decode_mp3(rep_bytes))
+            duration_ms += rep_ms
+
+            if r < self.args.repeat - 1:
+                chunks.append(self._silence_intra)
+                duration_ms += 300
+
+        # MP3 帧可直接按字节拼接，无需解码再编码
+        snippet_bytes = b"".join(chunks)
+
+        snippet_filename = f"snippet_{index}.mp3"
+        snippet_path = os.path.join(self.snippets_dir, snippet_filename)
+        with open(snippet_path, "wb") as f:
+            f.write(snippet_bytes)
+        self._snippets[index] = snippet_bytes
+
+        self.save_progress(index, {
+            "original": original,
+            "translation": translation,
+            "duration_ms": duration_ms,
+            "file": snippet_filename
+        })
 
     async def run(self):
         if not os.path.exists(self.args.input):
@@ -107,46 +245,71 @@ class MultiVoiceEngine:
             return
 
         # 读取 CSV
-        df = pd.read_csv(self.args.input)
-        tasks = [self.process_entry(i, r['原文'], r['平假名'], r['翻译']) for i, r in df.iterrows()]
-        await asyncio.gather(*tasks)
+        df = read_csv_fast(self.args.input)
+        # zip 直接取三列字符串，免去 iterrows 每行构造 Series 的开销
+        rows = zip(df['原文'], df['平假名'], df['翻译'])
+        tasks = [self.process_entry(i, o, h, t) for i, (o, h, t) in enumerate(rows)]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            self._flush_progress()
 
         print(f"\n[合并] 正在生成作品...")
-        final_audio = AudioSegment.empty()
+        # 断点续传的片段并行读取，避免合并循环里逐个等磁盘
+        missing = [i for i in range(len(df)) if str(i) in self.progress and i not in self._snippets]
+        if missing:
+            loop = asyncio.get_running_loop()
+            def _read_bytes(path):
+                with open(path, "rb") as f:
+                    return f.read()
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+                loaded = await asyncio.gather(*[
+                    loop.run_in_executor(
+                        pool, _read_bytes,
+                        os.path.join(self.snippets_dir, self.progress[str(i)]['file']))
+                    for i in missing])
+            self._snippets.update(zip(missing, loaded))
+
         srt_lines = []
         lrc_lines = [f"[ti:{self.base_name}]", "[by:Edge-TTS Batch]", ""]
         current_time_ms = 0
 
+        # 片段均为 Edge-TTS 同参数编码的 MP3，可直接按帧字节拼接，免去解码+重编码
+        silence_bytes = self._silence_inter
+        output_base = os.path.join(self.output_dir, self.base_name)
+
+        final_bytes = bytearray()
         for i in range(len(df)):
             meta = self.progress.get(str(i))
             if not meta: continue
 
-            snippet_path = os.path.join(self.snippets_dir, meta['file'])
-            snippet_audio = AudioSegment.from_mp3(snippet_path)
-            
+            snippet_bytes = self._snippets.get(i)
+            if snippet_bytes is None:
+                # 断点续传：上次运行的片段只在磁盘上
+                with open(os.path.join(self.snippets_dir, meta['file']), "rb") as f:
+                    snippet_bytes = f.read()
+
             start_ms = current_time_ms
             duration = meta['duration_ms']
             end_ms = start_ms + duration
 
-            # 字幕逻辑：第一行原文，第二行翻译
+            # 字幕逻辑：第一行原文，第二行翻译；时间戳各算一次，join 拼装少一轮中间字符串
             if self.args.sub_format in ['srt', 'both']:
                 s_t = self.format_srt_time(start_ms)
                 e_t = self.format_srt_time(end_ms)
-                srt_lines.append(f"{i+1}\n{s_t} --> {e_t}\n{meta['original']}\n{meta['translation']}\n")
+                srt_lines.append("\n".join((str(i + 1), f"{s_t} --> {e_t}", meta['original'], meta['translation'], "")))
 
             if self.args.sub_format in ['lrc', 'both']:
-                lrc_time = self.format_lrc_time(start_ms)
                 # LRC 合并为一行显示
-                lrc_lines.append(f"{lrc_time}{meta['original']} | {meta['translation']}")
-                lrc_lines.append(f"{self.format_lrc_time(end_ms)}")
+                lrc_lines.append("".join((self.format_lrc_time(start_ms), meta['original'], " | ", meta['translation'])))
+                lrc_lines.append(self.format_lrc_time(end_ms))
 
-            final_audio += snippet_audio
-            final_audio += AudioSegment.silent(duration=self.args.silence)
+            final_bytes += snippet_bytes
+            final_bytes += silence_bytes
             current_time_ms += duration + self.args.silence
 
-        # 输出文件
-        output_base = os.path.join(self.output_dir, self.base_name)
-        final_audio.export(f"{output_base}.mp3", format="mp3")
+        with open(f"{output_base}.mp3", "wb") as out:
+            out.write(final_bytes)
 
         if self.args.sub_format in ['srt', 'both']:
             with open(f"{output_base}.srt", "w", encoding="utf-8") as f:
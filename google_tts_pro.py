@@ -1,13 +1,62 @@
 import asyncio
+import functools
+import io
 import json
 import os
+import re
+import time
 import argparse
 import base64
 import httpx
+import numpy as np
 import pandas as pd
-from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
 from pydub import AudioSegment
+from pydub.silence import detect_nonsilent
 from tenacity import retry, stop_after_attempt, wait_exponential
+from xml.sax.saxutils import escape
+
+try:
+    import av  # PyAV：libav 进程内解码，免去每次解码 fork 一个 ffmpeg
+except ImportError:
+    av = None
+
+try:
+    import orjson  # checkpoint 序列化比 stdlib json 快一个量级
+except ImportError:
+    orjson = None
+
+try:
+    import h2  # noqa: F401  httpx 的 HTTP/2 支持依赖可选的 h2 包
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# SSML 批量合成：单次请求的字节上限与句间 <break> 时长。
+# Google TTS 的输入上限是 5000 字节（含 SSML 标记），日文 UTF-8 约 3 字节/字，
+# 必须按编码后的字节数统计；4500 给 <speak> 等标记留出余量
+SSML_BATCH_BYTE_LIMIT = 4500
+SSML_BREAK_MS = 800
+
+FLUSH_EVERY = 20  # 每累计多少行进度落盘一次 checkpoint
+
+# 发音修正表：TTS 容易读错的写法 -> 稳定读法（只影响送给 TTS 的文本，不影响字幕）
+PRONUNCIATION_FIXES = {
+    "月曜日": "げつようび",
+    "火曜日": "かようび",
+    "水曜日": "すいようび",
+    "木曜日": "もくようび",
+    "金曜日": "きんようび",
+    "土曜日": "どようび",
+    "日曜日": "にちようび",
+}
+
+def read_csv_fast(path):
+    """优先用 pyarrow 引擎解析 CSV（多线程 C 实现），未安装时退回默认引擎"""
+    try:
+        return pd.read_csv(path, engine="pyarrow")
+    except (ImportError, ValueError):
+        return pd.read_csv(path)
 
 def parse_args():
     parser = argparse.ArgumentParser(description="Google Cloud TTS 批量语音合成工具 (多女声修正版)")
@@ -16,11 +65,85 @@ def parse_args():
     parser.add_argument("-r", "--rate", type=float, default=0.9, help="语速 (0.25-4.0)")
     parser.add_argument("-n", "--repeat", type=int, default=3, help="单句重复次数")
     parser.add_argument("-c", "--concurrent", type=int, default=5, help="最大并发数")
+    parser.add_argument("-m", "--max_rps", type=float, default=5.0, help="每秒最大请求数 (0 表示不限速)")
     parser.add_argument("-s", "--silence", type=int, default=1000, help="句子间停顿(ms)")
     parser.add_argument("-o", "--output_dir", default="google_tts_output", help="输出目录")
     parser.add_argument("-f", "--sub_format", choices=['lrc', 'srt', 'both'], default='lrc', help="字幕格式")
     return parser.parse_args()
 
+def decode_mp3(data):
+    """MP3 字节 -> AudioSegment。优先 PyAV 进程内解码，未安装时退回 pydub+ffmpeg"""
+    if av is None:
+        return AudioSegment.from_file(io.BytesIO(data), format="mp3")
+    with av.open(io.BytesIO(data)) as container:
+        stream = container.streams.audio[0]
+        resampler = av.AudioResampler(format="s16", layout=stream.layout, rate=stream.sample_rate)
+        pcm = bytearray()
+        for frame in container.decode(stream):
+            for out in resampler.resample(frame):
+                pcm.extend(out.to_ndarray().tobytes())
+        return AudioSegment(bytes(pcm), sample_width=2,
+                            frame_rate=stream.sample_rate, channels=stream.channels)
+
+# Layer III 帧头解析表（用于识别并跳过 Xing/Info 信息帧）
+MP3_BITRATES_V1 = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320)
+MP3_BITRATES_V2 = (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)
+MP3_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+def strip_mp3_tags(data):
+    """去掉开头的 ID3v2 标签和 Xing/Info 信息帧。
+
+    ffmpeg 导出的 MP3 自带这两样：按字节拼进流中间会形成非法数据，
+    且 Xing 头只声明本段的帧数，混入整轨会让播放器误判总时长。
+    """
+    # ID3v2：10 字节固定头 + synchsafe 编码的标签长度
+    if data[:3] == b"ID3" and len(data) >= 10:
+        size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+        data = data[10 + size:]
+    # 首帧若是 Xing/Info 信息帧（不含音频），整帧丢弃
+    if len(data) > 4 and data[0] == 0xFF and (data[1] & 0xE0) == 0xE0:
+        version = (data[1] >> 3) & 0x03  # 3=MPEG1, 2=MPEG2, 0=MPEG2.5
+        bitrate_idx = (data[2] >> 4) & 0x0F
+        rate_idx = (data[2] >> 2) & 0x03
+        if version != 1 and bitrate_idx not in (0, 15) and rate_idx != 3:
+            bitrate = (MP3_BITRATES_V1 if version == 3 else MP3_BITRATES_V2)[bitrate_idx] * 1000
+            sample_rate = MP3_SAMPLE_RATES[version][rate_idx]
+            factor = 144 if version == 3 else 72
+            frame_len = factor * bitrate // sample_rate + ((data[2] >> 1) & 0x01)
+            if b"Xing" in data[:frame_len] or b"Info" in data[:frame_len]:
+                data = data[frame_len:]
+    return data
+
+@functools.lru_cache(maxsize=512)
+def decode_mp3_file(path):
+    # 断点续传/重复合并时同一片段不再二次解码
+    with open(path, "rb") as f:
+        return decode_mp3(f.read())
+
+def concat_segments(segments):
+    """预先算好总样本数，一次分配 int16 缓冲后按切片写入，拼接接近 memcpy 速度"""
+    if not segments:
+        return AudioSegment.empty()
+    base = segments[0]
+    spec = (base.frame_rate, base.sample_width, base.channels)
+    normalized = []
+    for seg in segments:
+        if (seg.frame_rate, seg.sample_width, seg.channels) != spec:
+            seg = seg.set_frame_rate(base.frame_rate).set_sample_width(base.sample_width).set_channels(base.channels)
+        normalized.append(seg)
+
+    if base.sample_width != 2:
+        # 非 16bit 样本走简单字节拼接
+        return base._spawn(b"".join(s._data for s in normalized))
+
+    arrays = [np.frombuffer(s._data, dtype=np.int16) for s in normalized]
+    out = np.empty(sum(a.size for a in arrays), dtype=np.int16)
+    offset = 0
+    for a in arrays:
+        out[offset:offset + a.size] = a
+        offset += a.size
+    return base._spawn(out.tobytes())
+
 class GoogleMultiVoiceEngine:
     def __init__(self, args):
         self.args = args
@@ -28,24 +151,67 @@ class GoogleMultiVoiceEngine:
         self.output_dir = args.output_dir
         self.snippets_dir = os.path.join(self.output_dir, f"{self.base_name}_snippets")
         self.progress_file = os.path.join(self.output_dir, f"{self.base_name}_checkpoint.json")
-        
+
         # 修正：Neural2-F を Neural2-C に変更（安定した女性音色の組み合わせ）
         self.voice_list = ["ja-JP-Neural2-B", "ja-JP-Neural2-C", "ja-JP-Wavenet-B"]
         self.semaphore = asyncio.Semaphore(args.concurrent)
-        
+        # 漏桶限速：按 1/max_rps 间隔放行请求，避免触发服务端限流和指数退避重试
+        self._rate_lock = asyncio.Lock()
+        self._last_request = 0.0
+        self._min_interval = 1 / args.max_rps if args.max_rps > 0 else 0.0
+        # 全局复用一个连接池，避免每次合成都重新进行 TCP+TLS 握手
+        # （未安装 h2 时退回 HTTP/1.1，keep-alive 依然生效）
+        self.http = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=20,
+            limits=httpx.Limits(
+                max_connections=args.concurrent * 2,
+                max_keepalive_connections=args.concurrent * 2,
+            ),
+        )
+
         os.makedirs(self.snippets_dir, exist_ok=True)
         self.progress = self.load_progress()
+        self._segments = {}  # 本次运行合成的音频缓存，合并阶段免去重新解码
+        self._snippet_bytes = {}  # 对应的 MP3 字节，LRC 快速通道直接按帧拼接
+        self._synth_cache = {}  # (文本, 音色) -> 合成任务，重复词条不再重复计费请求
+        self._prefetched = {}  # (行号, 重复序号) -> 批量预合成好的 AudioSegment
+        self._dirty = False
+        self._unflushed = 0
+        # 静音只生成一次，所有行复用同一个 AudioSegment
+        self._silence_intra = AudioSegment.silent(duration=400) # 句内停顿
+        self._silence_inter = AudioSegment.silent(duration=args.silence)
+        # 发音修正编译成单个正则，整表替换只扫描文本一遍
+        self._fix_re = re.compile("|".join(map(re.escape, sorted(PRONUNCIATION_FIXES, key=len, reverse=True))))
 
     def load_progress(self):
         if os.path.exists(self.progress_file):
-            with open(self.progress_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(self.progress_file, 'rb') as f:
+                data = f.read()
+            return orjson.loads(data) if orjson is not None else json.loads(data)
         return {}
 
     def save_progress(self, index, metadata):
         self.progress[str(index)] = metadata
-        with open(self.progress_file, 'w', encoding='utf-8') as f:
-            json.dump(self.progress, f, ensure_ascii=False, indent=2)
+        self._dirty = True
+        self._unflushed += 1
+        if self._unflushed >= FLUSH_EVERY:
+            self._flush_progress()
+
+    def _flush_progress(self):
+        """原子落盘：先写临时文件再 os.replace，中断也不会留下半截 JSON"""
+        if not self._dirty:
+            return
+        if orjson is not None:
+            payload = orjson.dumps(self.progress)
+        else:
+            payload = json.dumps(self.progress, ensure_ascii=False, separators=(",", ":")).encode('utf-8')
+        tmp_file = self.progress_file + ".tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_file, self.progress_file)
+        self._dirty = False
+        self._unflushed = 0
 
     def format_lrc_time(self, ms):
         m, s = divmod(ms // 1000, 60)
@@ -53,84 +219,234 @@ class GoogleMultiVoiceEngine:
         return f"[{m:02d}:{s:02d}.{cs:02d}]"
 
     def format_srt_time(self, ms):
-        td = timedelta(milliseconds=ms)
-        h, m, s = td.seconds // 3600, (td.seconds % 3600) // 60, td.seconds % 60
-        return f"{h:02d}:{m:02d}:{s:02d},{td.microseconds // 1000:03d}"
+        s, ms_part = divmod(ms, 1000)
+        m, s = divmod(s, 60)
+        h, m = divmod(m, 60)
+        return f"{h:02d}:{m:02d}:{s:02d},{ms_part:03d}"
+
+    def fix_pronunciation(self, text):
+        return self._fix_re.sub(lambda m: PRONUNCIATION_FIXES[m.group()], text)
+
+    async def _throttle(self):
+        if not self._min_interval:
+            return
+        async with self._rate_lock:
+            wait = self._min_interval - (time.monotonic() - self._last_request)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._last_request = time.monotonic()
 
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=6))
     async def synthesize_api(self, text, voice_name):
-        url = f"https://texttospeech.googleapis.com/v1/text:synthesize?key={self.args.key}"
-        payload = {
-            "input": {"text": text},
-            "voice": {"languageCode": "ja-JP", "name": voice_name},
-            "audioConfig": {"audioEncoding": "MP3", "speakingRate": self.args.rate}
-        }
-        async with httpx.AsyncClient() as client:
-            r = await client.post(url, json=payload, timeout=20)
-            if r.status_code == 200:
-                return base64.b64decode(r.json()["audioContent"])
-            # 音色エラーの場合はリトライせずに例外を投げる
-            if "does not exist" in r.text:
-                print(f"❌ エラー: 音色 {voice_name} が見つかりません。")
-                return None
-            raise Exception(f"API Error: {r.text}")
+        # 信号量放在单次请求上，而不是整行任务上，让并发额度均匀用满
+        async with self.semaphore:
+            await self._throttle()
+            url = f"https://texttospeech.googleapis.com/v1/text:synthesize?key={self.args.key}"
+            payload = {
+                "input": {"text": text},
+                "voice": {"languageCode": "ja-JP", "name": voice_name},
+                "audioConfig": {"audioEncoding": "MP3", "speakingRate": self.args.rate}
+            }
+            r = await self.http.post(url, json=payload)
+        if r.status_code == 200:
+            return base64.b64decode(r.json()["audioContent"])
+        # 音色エラーの場合はリトライせずに例外を投げる
+        if "does not exist" in r.text:
+            print(f"❌ エラー: 音色 {voice_name} が見つかりません。")
+            return None
+        raise Exception(f"API Error: {r.text}")
+
+    def synthesize_api_cached(self, text, voice_name):
+        """同一 (文本, 音色) 只请求一次：背单词 CSV 常有重复词条，直接共享任务结果"""
+        key = (text, voice_name)
+        task = self._synth_cache.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self.synthesize_api(text, voice_name))
+            self._synth_cache[key] = task
+        return task
+
+    async def synthesize_batch(self, texts, voice_name):
+        """多句打包成一次 SSML 请求，按 <break> 静音切分回每句；切分失败返回 None"""
+        async with self.semaphore:
+            await self._throttle()
+            url = f"https://texttospeech.googleapis.com/v1/text:synthesize?key={self.args.key}"
+            ssml = "<speak>" + f"<break time='{SSML_BREAK_MS}ms'/>".join(escape(t) for t in texts) + "</speak>"
+            payload = {
+                "input": {"ssml": ssml},
+                "voice": {"languageCode": "ja-JP", "name": voice_name},
+                "audioConfig": {"audioEncoding": "MP3", "speakingRate": self.args.rate}
+            }
+            r = await self.http.post(url, json=payload)
+        if r.status_code != 200:
+            return None
+        audio = base64.b64decode(r.json()["audioContent"])
+        seg = decode_mp3(audio)
+        ranges = detect_nonsilent(seg, min_silence_len=SSML_BREAK_MS - 200, silence_thresh=-45)
+        if len(ranges) != len(texts):
+            return None  # 切分数量与句数不符，由逐句请求兜底
+        # 两侧各留 50ms，避免静音检测切掉辅音起止
+        return [seg[max(0, s - 50):e + 50] for s, e in ranges]
+
+    async def prefetch_batches(self, sources):
+        """把待处理句子按字节上限分批预合成，请求次数从 行数*重复数 降到 批数*重复数"""
+        pending = [(i, s) for i, s in enumerate(sources) if str(i) not in self.progress]
+        if not pending:
+            return
+
+        break_overhead = len(f"<break time='{SSML_BREAK_MS}ms'/>")
+        batches, batch, size = [], [], 0
+        for item in pending:
+            # 按转义后的 UTF-8 字节数加标记开销统计，贴着 API 的真实上限打包
+            item_bytes = len(escape(self.fix_pronunciation(item[1])).encode("utf-8")) + break_overhead
+            if batch and size + item_bytes > SSML_BATCH_BYTE_LIMIT:
+                batches.append(batch)
+                batch, size = [], 0
+            batch.append(item)
+            size += item_bytes
+        if batch:
+            batches.append(batch)
+
+        async def fetch(r, voice, batch):
+            try:
+                segments = await self.synthesize_batch([self.fix_pronunciation(t) for _, t in batch], voice)
+            except Exception as e:
+                print(f"⚠️ 批量合成失败，相关句子将逐句请求: {e}")
+                return
+            if segments:
+                for (idx, _), seg in zip(batch, segments):
+                    self._prefetched[(idx, r)] = seg
+
+        tasks = []
+        for r in range(self.args.repeat):
+            voice = self.voice_list[r % len(self.voice_list)]
+            tasks += [fetch(r, voice, b) for b in batches]
+        await asyncio.gather(*tasks)
 
     async def process_entry(self, index, source, target):
         if str(index) in self.progress: return
-            
-        async with self.semaphore:
-            print(f"[处理中] {index}: {source[:15]}...")
-            combined = AudioSegment.empty()
-            
-            for r in range(self.args.repeat):
-                current_voice = self.voice_list[r % len(self.voice_list)]
-                audio_bytes = await self.synthesize_api(source, current_voice)
-                
-                if audio_bytes:
-                    temp_path = f"temp_{index}_{r}.mp3"
-                    with open(temp_path, "wb") as f: f.write(audio_bytes)
-                    snippet = AudioSegment.from_mp3(temp_path)
-                    combined += snippet
-                    if r < self.args.repeat - 1:
-                        combined += AudioSegment.silent(duration=400) # 句内停顿
-                    os.remove(temp_path)
-                else:
-                    return # 音声取得失敗時はスキップ
-
-            file_name = f"snippet_{index}.mp3"
-            combined.export(os.path.join(self.snippets_dir, file_name), format="mp3")
-            self.save_progress(index, {
-                "source": source, "target": target, "duration_ms": len(combined), "file": file_name
-            })
+
+        print(f"[处理中] {index}: {source[:15]}...")
+
+        async def fetch_rep(r):
+            snippet = self._prefetched.pop((index, r), None)
+            if snippet is None:
+                # 未命中批量预合成时逐句请求
+                audio_bytes = await self.synthesize_api_cached(
+                    self.fix_pronunciation(source), self.voice_list[r % len(self.voice_list)])
+                if not audio_bytes:
+                    return None
+                snippet = decode_mp3(audio_bytes)
+            return snippet
+
+        # 同一行的多次重复并发合成，按原顺序拼接
+        snippets = await asyncio.gather(*[fetch_rep(r) for r in range(self.args.repeat)])
+        if any(s is None for s in snippets):
+            return # 音声取得失敗時はスキップ
+
+        pieces = []
+        for r, snippet in enumerate(snippets):
+            pieces.append(snippet)
+            if r < self.args.repeat - 1:
+                pieces.append(self._silence_intra)
+
+        combined = concat_segments(pieces)
+
+        file_name = f"snippet_{index}.mp3"
+        buf = io.BytesIO()
+        combined.export(buf, format="mp3")
+        snippet_bytes = buf.getvalue()
+        with open(os.path.join(self.snippets_dir, file_name), "wb") as f:
+            f.write(snippet_bytes)
+        self._segments[index] = combined
+        self._snippet_bytes[index] = snippet_bytes
+        self.save_progress(index, {
+            "source": source, "target": target, "duration_ms": len(combined), "file": file_name
+        })
 
     async def run(self):
-        df = pd.read_csv(self.args.input)
-        tasks = [self.process_entry(i, row['source_text'], row['target_text']) for i, row in df.iterrows()]
-        await asyncio.gather(*tasks)
+        try:
+            df = read_csv_fast(self.args.input)
+            sources = list(df['source_text'])
+            await self.prefetch_batches(sources)
+            # zip 直接取两列字符串，免去 iterrows 每行构造 Series 的开销
+            tasks = [self.process_entry(i, s, t) for i, (s, t) in enumerate(zip(sources, df['target_text']))]
+            await asyncio.gather(*tasks)
+
+            print("\n[合并] 制作最終音声と字幕...")
+            lrc_lines = [f"[ti:{self.base_name}]", ""]
+            current_ms = 0
+
+            if self.args.sub_format == 'lrc':
+                # 快速通道（默认配置）：时间轴全部来自 checkpoint 元数据，
+                # MP3 片段直接按帧字节拼接，合并阶段完全不经过解码/重编码
+                final_bytes = bytearray()
+                silence_bytes = None
+
+                for i in range(len(df)):
+                    meta = self.progress.get(str(i))
+                    if not meta: continue
+
+                    data = self._snippet_bytes.get(i)
+                    if data is None:
+                        # 断点续传：上次运行的片段只在磁盘上
+                        with open(os.path.join(self.snippets_dir, meta['file']), "rb") as f:
+                            data = f.read()
+
+                    if silence_bytes is None:
+                        # 静音按片段的实际采样率编码一次
+                        rate = decode_mp3(data).frame_rate
+                        sil = io.BytesIO()
+                        self._silence_inter.set_frame_rate(rate).export(sil, format="mp3")
+                        silence_bytes = strip_mp3_tags(sil.getvalue())
+
+                    lrc_lines.append("".join((self.format_lrc_time(current_ms), meta['source'], " | ", meta['target'])))
+                    # 片段是 ffmpeg 导出，去掉各自的 ID3/Xing 头后再进整轨
+                    final_bytes += strip_mp3_tags(data)
+                    final_bytes += silence_bytes
+                    current_ms += meta['duration_ms'] + self.args.silence
+                    lrc_lines.append(self.format_lrc_time(current_ms)) # 清屏
+
+                with open(os.path.join(self.output_dir, f"{self.base_name}.mp3"), "wb") as out:
+                    out.write(final_bytes)
+            else:
+                # 断点续传的片段并行解码：ffmpeg 子进程可跨核重叠，且不阻塞事件循环
+                missing = [i for i in range(len(df)) if str(i) in self.progress and i not in self._segments]
+                if missing:
+                    loop = asyncio.get_running_loop()
+                    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+                        decoded = await asyncio.gather(*[
+                            loop.run_in_executor(
+                                pool, decode_mp3_file,
+                                os.path.join(self.snippets_dir, self.progress[str(i)]['file']))
+                            for i in missing])
+                    self._segments.update(zip(missing, decoded))
+
+                final_pieces = []
+
+                for i in range(len(df)):
+                    meta = self.progress.get(str(i))
+                    if not meta: continue
+
+                    snippet = self._segments.get(i)
+                    if snippet is None:
+                        # 断点续传：上次运行的片段只在磁盘上，需重新解码
+                        snippet = decode_mp3_file(os.path.join(self.snippets_dir, meta['file']))
+                    final_pieces.append(snippet)
+
+                    lrc_lines.append("".join((self.format_lrc_time(current_ms), meta['source'], " | ", meta['target'])))
+
+                    final_pieces.append(self._silence_inter)
+                    current_ms += meta['duration_ms'] + self.args.silence
+                    lrc_lines.append(self.format_lrc_time(current_ms)) # 清屏
 
-        print("\n[合并] 制作最終音声と字幕...")
-        final_audio = AudioSegment.empty()
-        srt_lines, lrc_lines = [], [f"[ti:{self.base_name}]", ""]
-        current_ms = 0
-
-        for i in range(len(df)):
-            meta = self.progress.get(str(i))
-            if not meta: continue
-            
-            snippet = AudioSegment.from_mp3(os.path.join(self.snippets_dir, meta['file']))
-            final_audio += snippet
-            
-            start_lrc = self.format_lrc_time(current_ms)
-            lrc_lines.append(f"{start_lrc}{meta['source']} | {meta['target']}")
-            
-            final_audio += AudioSegment.silent(duration=self.args.silence)
-            current_ms += meta['duration_ms'] + self.args.silence
-            lrc_lines.append(f"{self.format_lrc_time(current_ms)}") # 清屏
-
-        final_audio.export(os.path.join(self.output_dir, f"{self.base_name}.mp3"), format="mp3")
-        with open(os.path.join(self.output_dir, f"{self.base_name}.lrc"), "w", encoding="utf-8") as f:
-            f.write("\n".join(lrc_lines))
-        print(f"✅ 完了: {self.output_dir}")
+                final_audio = concat_segments(final_pieces)
+                final_audio.export(os.path.join(self.output_dir, f"{self.base_name}.mp3"), format="mp3")
+            with open(os.path.join(self.output_dir, f"{self.base_name}.lrc"), "w", encoding="utf-8") as f:
+                f.write("\n".join(lrc_lines))
+            print(f"✅ 完了: {self.output_dir}")
+        finally:
+            self._flush_progress()
+            await self.http.aclose()
 
 if __name__ == "__main__":
     args = parse_args()